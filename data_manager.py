@@ -8,8 +8,9 @@
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, scrolledtext
-import platform
-from information_database import InformationDatabase
+import json
+from config import config
+from information_database import InformationDatabase, format_timestamp
 
 class DataInputGUI:
     """
@@ -40,14 +41,7 @@ class DataInputGUI:
         根据操作系统自动选择合适的中文字体
         Windows使用微软雅黑，Mac使用苹方
         """
-        if platform.system() == "Windows":
-            # Windows系统使用微软雅黑字体
-            self.font_family = "Microsoft YaHei"
-        elif platform.system() == "Darwin":
-            # Mac系统使用苹方字体
-            self.font_family = "PingFang SC"
-        else:
-            self.font_family = "Arial"
+        self.font_family = config.get_font_config("default").family
     
     def setup_main_window(self):
         """
@@ -416,7 +410,6 @@ class DataInputGUI:
         if metadata_text:
             try:
                 # 尝试解析JSON格式的元数据
-                import json
                 metadata = json.loads(metadata_text)
             except:
                 # 如果不是JSON，则按行解析为键值对
@@ -462,7 +455,6 @@ class DataInputGUI:
         metadata = {}
         if metadata_text:
             try:
-                import json
                 metadata = json.loads(metadata_text)
             except:
                 for line in metadata_text.split('\n'):
@@ -545,7 +537,6 @@ class DataInputGUI:
                 metadata = entry.get('metadata', {})
                 if metadata:
                     try:
-                        import json
                         metadata_text = json.dumps(metadata, ensure_ascii=False, indent=2)
                     except:
                         metadata_text = '\n'.join([f"{k}: {v}" for k, v in metadata.items()])
@@ -557,8 +548,8 @@ class DataInputGUI:
         for item in self.tree.get_children():
             self.tree.delete(item)
         
-        # 添加所有条目
-        for entry in self.db.get_all_entries():
+        # 添加所有条目，只读遍历不需要复制条目列表
+        for entry in self.db.iter_entries():
             tags_text = ", ".join(entry['tags'][:2])  # 只显示前2个标签
             if len(entry['tags']) > 2:
                 tags_text += "..."
@@ -581,7 +572,7 @@ class DataInputGUI:
                 entry['title'][:25] + "..." if len(entry['title']) > 25 else entry['title'],
                 entry['url'][:15] + "..." if len(entry['url']) > 15 else entry['url'],
                 tags_text,
-                entry['created_at'][:10]  # 只显示日期
+                format_timestamp(entry['created_at'], "%Y-%m-%d")  # 只显示日期
             ))
         
         self.update_stats()
@@ -609,12 +600,13 @@ class DataInputGUI:
                 entry['title'][:30] + "..." if len(entry['title']) > 30 else entry['title'],
                 entry['url'][:20] + "..." if len(entry['url']) > 20 else entry['url'],
                 tags_text,
-                entry['created_at'][:10]
+                format_timestamp(entry['created_at'], "%Y-%m-%d")
             ))
     
     def save_database(self):
         """保存数据库"""
-        if self.db.save_data():
+        # 手动保存时把追加日志合并回数据文件
+        if self.db.save_data(force=True):
             messagebox.showinfo("成功", "数据库保存成功！")
         else:
             messagebox.showerror("错误", "数据库保存失败！")
@@ -883,7 +875,11 @@ class DataInputGUI:
     
     def run(self):
         """运行GUI"""
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            # 退出前把追加日志合并回数据文件，只浏览数据时不重写文件
+            self.db.compact()
 
 if __name__ == "__main__":
     app = DataInputGUI()
@@ -7,14 +7,18 @@
 """
 
 import tkinter as tk
-from tkinter import ttk, scrolledtext, messagebox
+from tkinter import ttk, messagebox
 import customtkinter as ctk
 import os
+import re
 import json
-import platform
 import subprocess
 import sys
 import traceback
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+from config import config
 
 # 尝试导入PIL，如果失败则禁用图片功能
 try:
@@ -24,14 +28,61 @@ except ImportError:
     PIL_AVAILABLE = False
     print("警告: PIL/Pillow未安装，将禁用图片功能")
 
+@functools.lru_cache(maxsize=None)
+def _load_image(path, size):
+    """加载并缩放图片，同一路径和尺寸只解码一次，引用由缓存持有避免被回收"""
+    return ImageTk.PhotoImage(Image.open(path).resize(size, Image.Resampling.LANCZOS))
+
 # 尝试导入新模块，如果失败则使用简化版本
 try:
-    from information_database import InformationDatabase
+    from information_database import InformationDatabase, format_timestamp
 except ImportError:
     print("错误: 找不到information_database.py模块")
     print("请确保information_database.py文件在同一目录下")
     sys.exit(1)
 
+# 内容类型的显示名称和结果行底色
+TYPE_NAMES = {
+    "article": "文章",
+    "link": "链接",
+    "image": "图片",
+    "video": "视频",
+    "code": "代码",
+    "news": "新闻",
+    "tutorial": "教程",
+    "tool": "工具",
+}
+
+TYPE_COLORS = {
+    "article": "#ffffff",
+    "link": "#e8f0fe",
+    "image": "#fce8e6",
+    "video": "#fef7e0",
+    "code": "#f1f3f4",
+    "news": "#e6f4ea",
+    "tutorial": "#f3e8fd",
+    "tool": "#e0f7fa",
+}
+
+# 结果列表每页显示的条数
+PAGE_SIZE = 50
+
+_QUERY_SPLIT_RE = re.compile(r"\s+")
+
+@functools.lru_cache(maxsize=64)
+def _get_highlight_pattern(query):
+    """把查询拆分为关键词并编译为一个忽略大小写的正则，同一查询只编译一次"""
+    # 长词优先，避免短词抢先匹配长词的前缀
+    words = sorted({word for word in _QUERY_SPLIT_RE.split(query) if word}, key=len, reverse=True)
+    if not words:
+        return None
+    return re.compile("|".join(map(re.escape, words)), re.IGNORECASE)
+
+def build_preview(result):
+    """生成搜索结果的内容摘要，超过200个字符时截断并加省略号"""
+    content = result["content"]
+    return content if len(content) <= 200 else content[:200] + "..."
+
 class SimpleGoogleApp:
     """
     简化版Google搜索应用
@@ -45,12 +96,7 @@ class SimpleGoogleApp:
         ctk.set_default_color_theme("blue")  # "blue", "green", "dark-blue"
         
         # 设置字体
-        if platform.system() == "Windows":
-            self.font_family = "Microsoft YaHei"
-        elif platform.system() == "Darwin":
-            self.font_family = "PingFang SC"  
-        else:
-            self.font_family = "Arial"
+        self.font_family = config.get_font_config("default").family
         
         # 创建信息库实例
         try:
@@ -59,9 +105,18 @@ class SimpleGoogleApp:
             messagebox.showerror("数据库错误", f"初始化信息库失败: {e}")
             sys.exit(1)
         
+        # 数据文件的修改时间，变化时重新加载数据
+        self._db_mtime = self._get_db_mtime()
+        
+        # 后台搜索线程，避免搜索时界面卡住
+        self._search_pool = ThreadPoolExecutor(max_workers=1)
+        self._search_future = None
+        self._last_query = None  # 最近一次发起的搜索，用于跳过正在进行的重复搜索
+        
         # 应用状态
         self.current_view = "search"
         self.search_results = []
+        self._page_index = 0  # 当前页第一条结果的下标
         self.current_page_data = {}
         self.current_query = ""  # 当前搜索查询，用于高亮显示
         
@@ -122,8 +177,12 @@ class SimpleGoogleApp:
             # 创建主界面
             self.setup_main_search()
             
-            # 绑定键盘事件
-            self.root.bind('<Return>', lambda e: self.perform_search())
+            # 预先创建结果界面和内容页面，切换时只显示/隐藏
+            self.setup_styles()
+            self.setup_results_view()
+            self.setup_page_view()
+            
+            # 绑定键盘事件（回车搜索只绑定在搜索框上）
             self.root.bind('<Escape>', lambda e: self.show_main_search())
             
         except Exception as e:
@@ -162,9 +221,7 @@ class SimpleGoogleApp:
             for logo_path in logo_paths:
                 try:
                     if os.path.exists(logo_path) and os.path.isfile(logo_path):
-                        img = Image.open(logo_path)
-                        img = img.resize((320, 110), Image.Resampling.LANCZOS)  # 稍大一些的logo
-                        self.google_logo = ImageTk.PhotoImage(img)
+                        self.google_logo = _load_image(logo_path, (320, 110))  # 稍大一些的logo
                         # 使用CTkLabel显示图片
                         logo_label = ctk.CTkLabel(logo_frame, image=self.google_logo, text="")
                         logo_label.pack()
@@ -198,6 +255,11 @@ class SimpleGoogleApp:
         self.search_entry.pack(padx=20, pady=15)
         self.search_entry.focus()
         
+        # 搜索状态提示
+        self.search_status_label = ctk.CTkLabel(search_frame, text="",
+                                               font=ctk.CTkFont(family=self.font_family, size=12))
+        self.search_status_label.pack()
+        
         # 绑定事件
         self.search_entry.bind('<Return>', lambda e: self.perform_search())
         
@@ -309,151 +371,89 @@ class SimpleGoogleApp:
             messagebox.showwarning("搜索提示", "请输入搜索关键词")
             return
         
+        # 相同查询正在后台搜索时（例如连按回车），不再重复提交
+        if query == self._last_query and self._search_future is not None:
+            return
+        self._last_query = query
+        
         try:
-            # 保存当前查询用于高亮显示
-            self.current_query = query
+            # 没有后台搜索在运行时才检查数据文件，避免搜索过程中重新加载
+            if self._search_future is None:
+                self._check_db_reload()
             
-            # 执行搜索
-            self.search_results = self.info_db.search(query)
-            
-            # 添加到历史
-            self.add_to_history(query)
-            
-            # 显示结果
-            self.current_view = "results"
-            self.show_search_results()
+            # 在后台线程执行搜索，主线程轮询结果
+            # 重复的查询由信息库的搜索缓存直接返回
+            self.search_status_label.configure(text="⏳ 搜索中...")
+            self._search_future = self._search_pool.submit(self.info_db.search, query)
+            self.root.after(20, self._poll_search, self._search_future, query)
             
         except Exception as e:
             messagebox.showerror("搜索错误", f"搜索失败: {e}")
     
-    def create_highlight_text(self, parent, text, font=None, bg="white", fg="#333", wraplength=800, height=None):
-        """创建带有关键词高亮的Text组件"""
-        import re
-        
-        # 创建Text组件
-        if height:
-            text_widget = tk.Text(parent, font=font or (self.font_family, 13), 
-                                 bg=bg, fg=fg, wrap=tk.WORD, height=height,
-                                 relief=tk.FLAT, bd=0, state=tk.NORMAL)
-        else:
-            text_widget = tk.Text(parent, font=font or (self.font_family, 13), 
-                                 bg=bg, fg=fg, wrap=tk.WORD,
-                                 relief=tk.FLAT, bd=0, state=tk.NORMAL)
-        
-        # 配置高亮标签
-        text_widget.tag_configure("highlight", background="#ffeb3b", foreground="#333")
+    def _poll_search(self, future, query):
+        """检查后台搜索是否完成，完成后在主线程显示结果"""
+        # 已经发起了新的搜索，丢弃旧的结果
+        if future is not self._search_future:
+            return
         
-        # 如果有搜索查询，进行高亮处理
-        if self.current_query and text:
-            # 分割查询词
-            query_words = [word.strip() for word in self.current_query.split() if word.strip()]
-            
-            # 插入文本并高亮关键词
-            current_pos = 0
-            text_lower = text.lower()
-            
-            # 找到所有匹配位置
-            matches = []
-            for word in query_words:
-                word_lower = word.lower()
-                start = 0
-                while True:
-                    pos = text_lower.find(word_lower, start)
-                    if pos == -1:
-                        break
-                    matches.append((pos, pos + len(word)))
-                    start = pos + 1
-            
-            # 按位置排序并合并重叠的匹配
-            matches.sort()
-            merged_matches = []
-            for start, end in matches:
-                if merged_matches and start <= merged_matches[-1][1]:
-                    # 合并重叠区间
-                    merged_matches[-1] = (merged_matches[-1][0], max(merged_matches[-1][1], end))
-                else:
-                    merged_matches.append((start, end))
-            
-            # 插入文本并应用高亮
-            last_end = 0
-            for start, end in merged_matches:
-                # 插入高亮前的普通文本
-                if start > last_end:
-                    text_widget.insert(tk.END, text[last_end:start])
-                # 插入高亮文本
-                text_widget.insert(tk.END, text[start:end], "highlight")
-                last_end = end
-            
-            # 插入剩余的普通文本
-            if last_end < len(text):
-                text_widget.insert(tk.END, text[last_end:])
-        else:
-            # 没有搜索查询或文本为空，直接插入文本
-            text_widget.insert(tk.END, text or "")
+        if not future.done():
+            self.root.after(20, self._poll_search, future, query)
+            return
         
-        # 设置为只读
-        text_widget.config(state=tk.DISABLED)
+        self._search_future = None
+        self.search_status_label.configure(text="")
         
-        # 计算合适的高度
-        if not height:
-            text_widget.update_idletasks()
-            lines = text_widget.get("1.0", tk.END).count('\n') + 1
-            if wraplength and len(text or "") > 0:
-                # 估算换行后的行数
-                estimated_lines = max(lines, len(text or "") // (wraplength // 10))
-                text_widget.config(height=min(estimated_lines, 8))
-            else:
-                text_widget.config(height=min(lines, 8))
+        try:
+            results = future.result()
+        except Exception as e:
+            messagebox.showerror("搜索错误", f"搜索失败: {e}")
+            return
         
-        return text_widget
+        self.apply_search_results(query, results)
     
-    def create_highlight_scrollable_text(self, parent, text, font=None, bg="white", fg="#333"):
-        """创建带有滚动条和关键词高亮的Text组件"""
-        import re
-        from tkinter import scrolledtext
-        
-        # 创建ScrolledText组件
-        text_widget = scrolledtext.ScrolledText(parent,
-                                              font=font or (self.font_family, 12),
-                                              bg=bg, fg=fg, wrap=tk.WORD,
-                                              relief=tk.FLAT, bd=0, state=tk.NORMAL)
-        
-        # 配置高亮标签
-        text_widget.tag_configure("highlight", background="#ffeb3b", foreground="#333")
+    def apply_search_results(self, query, results):
+        """显示一次搜索的结果"""
+        # 保存当前查询用于高亮显示
+        self.current_query = query
+        self.search_results = results
+        self._page_index = 0
+        
+        # 添加到历史
+        self.add_to_history(query)
+        
+        # 显示结果
+        self.populate_results()
+        self.show_search_results()
+    
+    def _get_db_mtime(self):
+        """获取数据文件和追加日志的修改时间，文件不存在时对应项为None"""
+        mtimes = []
+        for path in (self.info_db.data_file, self.info_db.log_file):
+            try:
+                mtimes.append(os.path.getmtime(path))
+            except OSError:
+                mtimes.append(None)
+        return tuple(mtimes)
+    
+    def _check_db_reload(self):
+        """数据文件被数据管理程序修改后，重新加载数据（同时清空信息库的搜索缓存）"""
+        mtime = self._get_db_mtime()
+        if mtime != self._db_mtime:
+            self._db_mtime = mtime
+            self.info_db.load_data()
+    
+    def set_highlight_text(self, text_widget, text):
+        """替换Text组件的内容并高亮关键词"""
+        text_widget.config(state=tk.NORMAL)
+        text_widget.delete("1.0", tk.END)
         
         # 如果有搜索查询，进行高亮处理
-        if self.current_query and text:
-            # 分割查询词
-            query_words = [word.strip() for word in self.current_query.split() if word.strip()]
-            
-            # 插入文本并高亮关键词
-            text_lower = text.lower()
-            
-            # 找到所有匹配位置
-            matches = []
-            for word in query_words:
-                word_lower = word.lower()
-                start = 0
-                while True:
-                    pos = text_lower.find(word_lower, start)
-                    if pos == -1:
-                        break
-                    matches.append((pos, pos + len(word)))
-                    start = pos + 1
-            
-            # 按位置排序并合并重叠的匹配
-            matches.sort()
-            merged_matches = []
-            for start, end in matches:
-                if merged_matches and start <= merged_matches[-1][1]:
-                    # 合并重叠区间
-                    merged_matches[-1] = (merged_matches[-1][0], max(merged_matches[-1][1], end))
-                else:
-                    merged_matches.append((start, end))
-            
+        pattern = _get_highlight_pattern(self.current_query) if self.current_query and text else None
+        if pattern:
             # 插入文本并应用高亮
             last_end = 0
-            for start, end in merged_matches:
+            for match in pattern.finditer(text):
+                start, end = match.span()
                 # 插入高亮前的普通文本
                 if start > last_end:
                     text_widget.insert(tk.END, text[last_end:start])
@@ -470,252 +470,228 @@ class SimpleGoogleApp:
         
         # 设置为只读
         text_widget.config(state=tk.DISABLED)
+    
+    def setup_styles(self):
+        """配置结果界面和内容页面的ttk样式，所有组件共享同一套样式"""
+        # 保留系统默认主题（Windows上为vista，macOS上为aqua），返回按钮使用原生外观
+        style = ttk.Style(self.root)
+        
+        style.configure("Page.TFrame", background="white")
+        style.configure("Title.TLabel", background="white", foreground="#333",
+                        font=(self.font_family, 18, "bold"))
+        style.configure("Hint.TLabel", background="white", foreground="#666",
+                        font=(self.font_family, 12))
+        style.configure("Icon.TLabel", background="white", foreground="#ccc",
+                        font=(self.font_family, 48))
+        
+        style.configure("Back.TButton", font=(self.font_family, 12), padding=(15, 8))
+        
+        style.configure("Results.Treeview", font=(self.font_family, 12), rowheight=28)
+        style.configure("Results.Treeview.Heading", font=(self.font_family, 12, "bold"))
+    
+    def setup_results_view(self):
+        """创建搜索结果界面（只创建一次）"""
+        self.results_frame = ttk.Frame(self.root, style="Page.TFrame")
+        
+        # 创建头部
+        header_frame = ttk.Frame(self.results_frame, style="Page.TFrame", height=80)
+        header_frame.pack(fill=tk.X, padx=20, pady=10)
+        header_frame.pack_propagate(False)
+        
+        # 返回按钮
+        back_button = ttk.Button(header_frame, text="← 返回搜索",
+                                 style="Back.TButton",
+                                 command=self.show_main_search)
+        back_button.pack(side=tk.LEFT, pady=10)
+        
+        # 结果标题
+        self.results_title_label = ttk.Label(header_frame, text="", style="Title.TLabel")
+        self.results_title_label.pack(side=tk.LEFT, padx=(20, 0), pady=10)
+        
+        # 翻页按钮
+        self.next_page_button = ttk.Button(header_frame, text="下一页",
+                                           command=lambda: self.change_page(1))
+        self.next_page_button.pack(side=tk.RIGHT, pady=10)
+        self.prev_page_button = ttk.Button(header_frame, text="上一页",
+                                           command=lambda: self.change_page(-1))
+        self.prev_page_button.pack(side=tk.RIGHT, padx=(0, 10), pady=10)
+        
+        # 内容区域
+        content_frame = ttk.Frame(self.results_frame, style="Page.TFrame")
+        content_frame.pack(fill=tk.BOTH, expand=True, padx=20)
+        
+        # 结果列表
+        self.results_list_frame = ttk.Frame(content_frame, style="Page.TFrame")
+        self.create_results_list(self.results_list_frame)
+        
+        # 无结果提示
+        self.no_results_frame = ttk.Frame(content_frame, style="Page.TFrame")
+        
+        ttk.Label(self.no_results_frame, text="🔍",
+                  style="Icon.TLabel").pack(pady=(100, 20))
+        
+        ttk.Label(self.no_results_frame, text="未找到匹配的结果",
+                  style="Title.TLabel").pack()
+        
+        suggestion_text = "建议:\n• 尝试使用不同的关键词\n• 检查拼写是否正确\n• 尝试更简短的搜索词"
+        ttk.Label(self.no_results_frame, text=suggestion_text,
+                  style="Hint.TLabel",
+                  justify=tk.LEFT).pack(pady=(20, 0))
+    
+    def populate_results(self):
+        """用当前搜索结果刷新结果界面，只渲染当前页"""
+        total = len(self.search_results)
+        start = self._page_index
+        end = min(start + PAGE_SIZE, total)
+        
+        if total > PAGE_SIZE:
+            self.results_title_label.config(text=f"搜索结果 ({total} 条, 显示 {start + 1}-{end})")
+        else:
+            self.results_title_label.config(text=f"搜索结果 ({total} 条)")
         
-        return text_widget
+        # 第一页/最后一页时禁用对应的翻页按钮
+        self.prev_page_button.state(["!disabled"] if start > 0 else ["disabled"])
+        self.next_page_button.state(["!disabled"] if end < total else ["disabled"])
+        
+        # 清空旧的结果行
+        tree = self.results_tree
+        tree.delete(*tree.get_children())
+        
+        if not self.search_results:
+            self.results_list_frame.pack_forget()
+            self.no_results_frame.pack(expand=True, fill=tk.BOTH)
+            return
+        
+        self.no_results_frame.pack_forget()
+        self.results_list_frame.pack(expand=True, fill=tk.BOTH)
+        
+        # 显示当前页的结果，行ID即结果在完整列表中的下标
+        for i in range(start, end):
+            result = self.search_results[i]
+            content_type = result.get("content_type", "article")
+            tree.insert("", tk.END, iid=str(i), tags=(content_type,), values=(
+                TYPE_NAMES.get(content_type, content_type),
+                result['title'],
+                result.get('url', ''),
+                build_preview(result).replace("\n", " ")
+            ))
+        tree.yview_moveto(0)
+    
+    def change_page(self, step):
+        """向前或向后翻一页"""
+        new_index = self._page_index + step * PAGE_SIZE
+        if 0 <= new_index < len(self.search_results):
+            self._page_index = new_index
+            self.populate_results()
     
     def show_search_results(self):
         """显示搜索结果"""
         try:
             # 隐藏主界面和内容页面
-            if hasattr(self, 'main_frame') and self.main_frame.winfo_exists():
+            if self.main_frame and self.main_frame.winfo_exists():
                 self.main_frame.pack_forget()
-            if hasattr(self, 'page_frame') and self.page_frame and self.page_frame.winfo_exists():
-                self.page_frame.pack_forget()
+            self.page_frame.pack_forget()
             
-            # 销毁旧的结果界面
-            if self.results_frame and self.results_frame.winfo_exists():
-                self.results_frame.destroy()
+            # 清除选中状态，保证再次点击同一行也能打开
+            self.results_tree.selection_remove(self.results_tree.selection())
             
-            # 创建结果界面
-            self.results_frame = tk.Frame(self.root, bg="white")
             self.results_frame.pack(fill=tk.BOTH, expand=True)
-            
-            # 创建头部
-            header_frame = tk.Frame(self.results_frame, bg="white", height=80)
-            header_frame.pack(fill=tk.X, padx=20, pady=10)
-            header_frame.pack_propagate(False)
-            
-            # 返回按钮
-            back_button = tk.Button(header_frame, text="← 返回搜索",
-                                  font=(self.font_family, 12),
-                                  bg="#4285f4", fg="white",
-                                  relief=tk.FLAT, padx=15, pady=8,
-                                  command=self.show_main_search)
-            back_button.pack(side=tk.LEFT, pady=10)
-            
-            # 结果标题
-            title_label = tk.Label(header_frame,
-                                 text=f"搜索结果 ({len(self.search_results)} 条)",
-                                 font=(self.font_family, 18, "bold"),
-                                 bg="white", fg="#333")
-            title_label.pack(side=tk.LEFT, padx=(20, 0), pady=10)
-            
-            # 内容区域
-            content_frame = tk.Frame(self.results_frame, bg="white")
-            content_frame.pack(fill=tk.BOTH, expand=True, padx=20)
-            
-            if not self.search_results:
-                # 无结果提示
-                no_results_frame = tk.Frame(content_frame, bg="white")
-                no_results_frame.pack(expand=True, fill=tk.BOTH)
-                
-                tk.Label(no_results_frame, text="🔍",
-                        font=(self.font_family, 48),
-                        bg="white", fg="#ccc").pack(pady=(100, 20))
-                
-                tk.Label(no_results_frame, text="未找到匹配的结果",
-                        font=(self.font_family, 18, "bold"),
-                        bg="white", fg="#333").pack()
-                
-                suggestion_text = "建议:\\n• 尝试使用不同的关键词\\n• 检查拼写是否正确\\n• 尝试更简短的搜索词"
-                tk.Label(no_results_frame, text=suggestion_text,
-                        font=(self.font_family, 12),
-                        bg="white", fg="#666",
-                        justify=tk.LEFT).pack(pady=(20, 0))
-            else:
-                # 显示结果列表
-                self.create_results_list(content_frame)
+            self.current_view = "results"
         
         except Exception as e:
             messagebox.showerror("界面错误", f"显示搜索结果失败: {e}")
     
     def create_results_list(self, parent):
         """创建搜索结果列表"""
-        # 创建滚动区域
-        canvas = tk.Canvas(parent, bg="white", highlightthickness=0)
-        scrollbar = ttk.Scrollbar(parent, orient="vertical", command=canvas.yview)
-        scrollable_content = tk.Frame(canvas, bg="white")
+        # 使用Treeview显示结果，只有可见行才会被绘制
+        columns = ("type", "title", "url", "preview")
+        tree = ttk.Treeview(parent, columns=columns, show="headings", height=20,
+                            style="Results.Treeview")
         
-        scrollable_content.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        tree.heading("type", text="类型")
+        tree.heading("title", text="标题")
+        tree.heading("url", text="URL")
+        tree.heading("preview", text="摘要")
         
-        canvas.create_window((0, 0), window=scrollable_content, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+        tree.column("type", width=60, stretch=False)
+        tree.column("title", width=300)
+        tree.column("url", width=200)
+        tree.column("preview", width=500)
         
-        # 添加鼠标滚轮支持
-        def _on_mousewheel(event):
-            try:
-                # Windows和Linux的滚轮事件处理
-                if event.delta:
-                    canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-                else:
-                    # Linux系统的滚轮事件
-                    if event.num == 4:
-                        canvas.yview_scroll(-1, "units")
-                    elif event.num == 5:
-                        canvas.yview_scroll(1, "units")
-            except Exception as e:
-                print(f"滚轮事件处理失败: {e}")
-        
-        # 绑定滚轮事件的递归函数
-        def bind_mousewheel(widget):
-            """递归绑定滚轮事件到所有子组件"""
-            try:
-                widget.bind("<MouseWheel>", _on_mousewheel)
-                widget.bind("<Button-4>", _on_mousewheel)  
-                widget.bind("<Button-5>", _on_mousewheel)
-                for child in widget.winfo_children():
-                    bind_mousewheel(child)
-            except Exception as e:
-                print(f"绑定滚轮事件失败: {e}")
-        
-        # 绑定滚轮事件到所有相关组件
-        bind_mousewheel(canvas)
-        bind_mousewheel(scrollable_content)
-        bind_mousewheel(parent)
-        
-        # 绑定鼠标进入和离开事件来设置焦点
-        def on_enter(event):
-            canvas.focus_set()
-            
-        canvas.bind("<Enter>", on_enter)
-        scrollable_content.bind("<Enter>", on_enter)
+        # 每种内容类型对应一个行标签，用底色区分类型
+        for content_type, color in TYPE_COLORS.items():
+            tree.tag_configure(content_type, background=color)
         
-        # 布局滚动组件
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        scrollbar = ttk.Scrollbar(parent, orient="vertical", command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set)
         
-        # 显示搜索结果
-        for i, result in enumerate(self.search_results):
-            self.create_result_item(scrollable_content, result, i)
+        # 选中结果行时打开内容页面
+        tree.bind("<<TreeviewSelect>>", self.on_result_select)
         
-        # 最后再次绑定滚轮事件到所有新创建的组件
-        bind_mousewheel(scrollable_content)
-            
-        # 保存canvas引用用于后续操作
-        self.results_canvas = canvas
+        # 布局列表和滚动条
+        tree.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+        
+        # 保存列表引用用于后续操作
+        self.results_tree = tree
     
-    def create_result_item(self, parent, result, index):
-        """创建单个搜索结果项"""
-        try:
-            # 结果项容器
-            result_item = tk.Frame(parent, bg="white")
-            result_item.pack(fill=tk.X, padx=20, pady=15)
-            
-            # 标题 - 使用高亮文本组件，但保持可点击性
-            title_text = self.create_highlight_text(
-                result_item, result['title'],
-                font=(self.font_family, 16, "bold"),
-                bg="white", fg="#1a0dab",
-                height=1
-            )
-            title_text.pack(anchor=tk.W, fill=tk.X)
-            title_text.config(cursor="hand2", state=tk.NORMAL)
-            title_text.bind("<Button-1>", lambda e, r=result: self.show_content_page(r))
-            # 添加下划线效果
-            title_text.tag_configure("underline", underline=True)
-            title_text.tag_add("underline", "1.0", "end-1c")
-            title_text.config(state=tk.DISABLED)
-            
-            # URL
-            if result.get('url'):
-                url_label = tk.Label(result_item, text=result['url'],
-                                   font=(self.font_family, 12),
-                                   bg="white", fg="#006621",
-                                   anchor="w")
-                url_label.pack(anchor=tk.W, pady=(2, 0))
-            
-            # 内容摘要 - 使用高亮文本组件
-            content_preview = (result['content'][:200] + "..."
-                             if len(result['content']) > 200
-                             else result['content'])
-            content_text = self.create_highlight_text(
-                result_item, content_preview,
-                font=(self.font_family, 13),
-                bg="white", fg="#545454",
-                wraplength=800,
-                height=3
-            )
-            content_text.pack(anchor=tk.W, fill=tk.X, pady=(5, 0))
-            
-            # 标签
-            if result.get('tags'):
-                tags_text = "标签: " + ", ".join(result['tags'][:5])
-                tags_label = tk.Label(result_item, text=tags_text,
-                                     font=(self.font_family, 11),
-                                     bg="white", fg="#808080",
-                                     anchor="w")
-                tags_label.pack(anchor=tk.W, pady=(5, 0))
-            
-            # 分隔线
-            separator = tk.Frame(parent, height=1, bg="#e8e8e8")
-            separator.pack(fill=tk.X, padx=20, pady=(10, 0))
-            
-        except Exception as e:
-            print(f"创建搜索结果项失败: {e}")
+    def on_result_select(self, event):
+        """结果行选中事件"""
+        selection = self.results_tree.selection()
+        if selection:
+            self.show_content_page(self.search_results[int(selection[0])])
+    
+    def setup_page_view(self):
+        """创建内容详情页面（只创建一次）"""
+        self.page_frame = ttk.Frame(self.root, style="Page.TFrame")
+        
+        # 创建头部
+        header_frame = ttk.Frame(self.page_frame, style="Page.TFrame", height=60)
+        header_frame.pack(fill=tk.X, padx=20, pady=10)
+        header_frame.pack_propagate(False)
+        
+        # 返回按钮
+        back_button = ttk.Button(header_frame, text="← 返回结果",
+                                 style="Back.TButton",
+                                 command=self.show_search_results)
+        back_button.pack(side=tk.LEFT, pady=10)
+        
+        # 页面标题
+        self.page_title_label = ttk.Label(header_frame, text="", style="Title.TLabel")
+        self.page_title_label.pack(side=tk.LEFT, padx=(20, 0), pady=10)
+        
+        # 内容区域
+        content_frame = ttk.Frame(self.page_frame, style="Page.TFrame")
+        content_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=(0, 20))
+        
+        # 内容文本区域和滚动条
+        self.page_text = tk.Text(content_frame,
+                                 font=(self.font_family, 12),
+                                 bg="white", fg="#333", wrap=tk.WORD,
+                                 relief=tk.FLAT, bd=0, state=tk.DISABLED)
+        self.page_text.tag_configure("highlight", background="#ffeb3b", foreground="#333")
+        scrollbar = ttk.Scrollbar(content_frame, orient="vertical", command=self.page_text.yview)
+        self.page_text.configure(yscrollcommand=scrollbar.set)
+        
+        self.page_text.pack(side="left", fill=tk.BOTH, expand=True)
+        scrollbar.pack(side="right", fill="y")
     
     def show_content_page(self, result_data):
         """显示内容详情页面"""
         try:
             self.current_page_data = result_data
-            self.current_view = "page"
             
-            # 隐藏结果界面（安全检查）
-            if hasattr(self, 'results_frame') and self.results_frame and self.results_frame.winfo_exists():
-                self.results_frame.pack_forget()
+            # 隐藏结果界面
+            self.results_frame.pack_forget()
             
-            # 销毁旧的内容页面
-            if self.page_frame:
-                self.page_frame.destroy()
+            # 更新页面标题和内容
+            self.page_title_label.config(text=result_data.get('title', '无标题'))
+            content = self.format_content_for_display(result_data)
+            self.set_highlight_text(self.page_text, content)
+            self.page_text.yview_moveto(0)
             
-            # 创建内容页面
-            self.page_frame = tk.Frame(self.root, bg="white")
             self.page_frame.pack(fill=tk.BOTH, expand=True)
-            
-            # 创建头部
-            header_frame = tk.Frame(self.page_frame, bg="white", height=60)
-            header_frame.pack(fill=tk.X, padx=20, pady=10)
-            header_frame.pack_propagate(False)
-            
-            # 返回按钮
-            back_button = tk.Button(header_frame, text="← 返回结果",
-                                  font=(self.font_family, 12),
-                                  bg="#4285f4", fg="white",
-                                  relief=tk.FLAT, padx=15, pady=8,
-                                  command=self.show_search_results)
-            back_button.pack(side=tk.LEFT, pady=10)
-            
-            # 页面标题
-            title_label = tk.Label(header_frame,
-                                 text=result_data.get('title', '无标题'),
-                                 font=(self.font_family, 18, "bold"),
-                                 bg="white", fg="#333")
-            title_label.pack(side=tk.LEFT, padx=(20, 0), pady=10)
-            
-            # 内容区域
-            content_frame = tk.Frame(self.page_frame, bg="white")
-            content_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=(0, 20))
-            
-            # 使用自定义的高亮文本区域
-            content = self.format_content_for_display(result_data)
-            text_area = self.create_highlight_scrollable_text(
-                content_frame, content,
-                font=(self.font_family, 12),
-                bg="white", fg="#333"
-            )
-            text_area.pack(fill=tk.BOTH, expand=True)
+            self.current_view = "page"
             
         except Exception as e:
             messagebox.showerror("页面错误", f"显示内容页面失败: {e}")
@@ -741,9 +717,9 @@ class SimpleGoogleApp:
         
         # 时间信息
         if result.get('created_at'):
-            content_lines.append(f"创建时间: {result['created_at']}")
+            content_lines.append(f"创建时间: {format_timestamp(result['created_at'])}")
         if result.get('updated_at'):
-            content_lines.append(f"更新时间: {result['updated_at']}")
+            content_lines.append(f"更新时间: {format_timestamp(result['updated_at'])}")
         if result.get('created_at') or result.get('updated_at'):
             content_lines.append("")
         
@@ -757,11 +733,9 @@ class SimpleGoogleApp:
     def show_main_search(self):
         """显示主搜索界面"""
         try:
-            # 隐藏其他界面（安全检查）
-            if hasattr(self, 'results_frame') and self.results_frame and self.results_frame.winfo_exists():
-                self.results_frame.pack_forget()
-            if hasattr(self, 'page_frame') and self.page_frame and self.page_frame.winfo_exists():
-                self.page_frame.pack_forget()
+            # 隐藏其他界面
+            self.results_frame.pack_forget()
+            self.page_frame.pack_forget()
             
             # 确保主界面存在且可见
             if hasattr(self, 'main_frame') and self.main_frame.winfo_exists():
@@ -806,6 +780,7 @@ class SimpleGoogleApp:
         finally:
             # 保存搜索历史
             self.save_simple_history()
+            self._search_pool.shutdown(wait=False)
 
 def main():
     """主函数"""
@@ -6,11 +6,53 @@
 支持JSON文件存储、GUI数据输入、导入导出等功能
 """
 
+import heapq
 import json
-import re
 import os
+import time
+import zlib
+from collections import OrderedDict
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Dict, Iterator, List, Optional, Union
+
+# 尝试导入orjson，可用时用它读写数据文件，否则使用标准库json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# 追加日志中的条目超过这个数量时，保存时合并回数据文件
+LOG_COMPACT_THRESHOLD = 100
+
+# 搜索结果缓存最多保存的查询数
+SEARCH_CACHE_SIZE = 128
+
+# 旧版本数据文件中时间字段使用的字符串格式
+_LEGACY_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+def format_timestamp(value: Union[int, float, str, None], fmt: str = _LEGACY_TIME_FORMAT) -> str:
+    """
+    格式化条目的时间字段用于显示
+    新条目保存的是Unix时间戳（秒），旧数据文件中是"YYYY-MM-DD HH:MM:SS"字符串，两种都支持
+    
+    Args:
+        value: 时间戳或旧格式的时间字符串
+        fmt: 输出格式，默认与旧格式相同
+        
+    Returns:
+        格式化后的时间字符串，无法解析时原样返回
+    """
+    if value is None or value == "":
+        return ""
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value).strftime(fmt)
+    if fmt == _LEGACY_TIME_FORMAT:
+        return value
+    try:
+        return datetime.strptime(value, _LEGACY_TIME_FORMAT).strftime(fmt)
+    except ValueError:
+        return value
 
 class InformationDatabase:
     """
@@ -22,52 +64,211 @@ class InformationDatabase:
     def __init__(self, data_file: str = "information_database.json"):
         """
         初始化信息库
-        设置数据文件路径，初始化数据列表，加载现有数据
+        设置数据文件路径，初始化数据字典，加载现有数据
         
         Args:
             data_file: 数据文件路径，默认为"information_database.json"
         """
         # 设置数据文件路径
         self.data_file = data_file
-        # 初始化数据列表，用于存储所有信息条目
-        self.data = []
+        # 新增条目先追加到日志文件，避免每次添加都重写整个数据文件
+        self.log_file = data_file + ".log"
+        # 初始化数据字典，以条目ID为键存储所有信息条目
+        self.data = {}
         # 从文件加载现有数据
         self.load_data()
     
     def load_data(self):
         """
         从JSON文件加载数据
-        如果文件存在则读取数据，否则创建空的数据列表
+        如果文件存在则读取数据，否则创建空的信息库
         """
+        # 数据文件内容的校验值，用来判断追加日志是否基于当前数据文件
+        self._file_crc = None
         try:
             # 检查数据文件是否存在
             if os.path.exists(self.data_file):
                 # 如果文件存在，打开并读取JSON数据
-                with open(self.data_file, 'r', encoding='utf-8') as f:
-                    self.data = json.load(f)
+                with open(self.data_file, 'rb') as f:
+                    raw = f.read()
+                entries = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw.decode('utf-8'))
+                self._file_crc = zlib.crc32(raw)
                 # 打印成功加载的数据条数
-                print(f"成功加载 {len(self.data)} 条数据")
+                print(f"成功加载 {len(entries)} 条数据")
             else:
                 # 如果文件不存在，创建新的空数据列表
                 print("数据文件不存在，创建新的信息库")
-                self.data = []
+                entries = []
         except Exception as e:
             # 如果加载过程中出现错误，打印错误信息并创建空数据列表
             print(f"加载数据失败: {e}")
-            self.data = []
+            entries = []
+        
+        # 内存中的数据与文件一致
+        self._dirty = False
+        self._pending_appends = []
+        # 回放追加日志中尚未合并到数据文件的新增条目
+        self._log_count = self._replay_log(entries)
+        
+        # 文件中保存的是条目列表，转换为以ID为键的字典
+        self._build_storage(entries)
+        
+        # 数据加载完成后，预先计算搜索用的小写字段
+        self._rebuild_columns()
+    
+    def _build_storage(self, entries: List[Dict]):
+        """
+        把条目列表转换为以ID为键的字典
+        旧数据文件中可能存在重复ID，重复的条目分配新ID
+        """
+        self.data = {}
+        duplicates = []
+        migrated = False
+        for entry in entries:
+            # 旧版本保存的合并搜索文本已不再使用，加载时去掉
+            if entry.pop("searchable_text", None) is not None:
+                migrated = True
+            if entry["id"] in self.data:
+                duplicates.append(entry)
+            else:
+                self.data[entry["id"]] = entry
+        
+        next_id = max(self.data, default=0) + 1
+        for entry in duplicates:
+            entry["id"] = next_id
+            self.data[next_id] = entry
+            next_id += 1
+        # 下一个新条目使用的ID，添加条目时不必重新计算最大ID
+        self._next_id = next_id
+        
+        if duplicates:
+            print(f"为 {len(duplicates)} 条重复ID的条目重新分配ID")
+        
+        # 新ID和去掉的字段需要写回数据文件
+        if duplicates or migrated:
+            self._dirty = True
     
-    def save_data(self):
+    def _rebuild_columns(self):
+        """
+        重建搜索用的小写字段列
+        每列都是条目ID到小写字段的字典，搜索时不必对每个条目重复调用lower()
+        """
+        self._titles_lc: Dict[int, str] = {}
+        self._contents_lc: Dict[int, str] = {}
+        self._tags_lc: Dict[int, List[str]] = {}
+        
+        # 搜索结果缓存：(小写查询, limit) -> 结果列表，按最近使用顺序排列
+        self._search_cache: "OrderedDict[tuple, List[Dict]]" = OrderedDict()
+        
+        for entry in self.data.values():
+            self._index_entry(entry)
+    
+    def _index_entry(self, entry: Dict):
+        """为新加入或修改后的条目生成小写字段"""
+        entry_id = entry["id"]
+        self._titles_lc[entry_id] = entry["title"].lower()
+        self._contents_lc[entry_id] = entry["content"].lower()
+        self._tags_lc[entry_id] = [tag.lower() for tag in entry["tags"]]
+        # 数据发生变化，缓存的搜索结果全部失效
+        self._search_cache.clear()
+    
+    def _unindex_entry(self, entry_id: int):
+        """条目被删除后，删除它的小写字段"""
+        del self._titles_lc[entry_id]
+        del self._contents_lc[entry_id]
+        del self._tags_lc[entry_id]
+        self._search_cache.clear()
+    
+    def _replay_log(self, entries: List[Dict]) -> int:
+        """
+        把追加日志中的条目加入从数据文件读取的条目列表
+        日志第一行记录写入时数据文件的校验值，与当前数据文件不一致时说明日志已合并过
+        （合并后、删除日志前中断）或数据文件已被重写，整个日志作废，避免已删除或修改的条目被恢复
+        
+        Returns:
+            有效日志中的条目数
+        """
+        if not os.path.exists(self.log_file):
+            return 0
+        
+        count = 0
+        try:
+            with open(self.log_file, 'rb') as f:
+                try:
+                    header = json.loads(f.readline())
+                except ValueError:
+                    header = None
+                if not isinstance(header, dict) or header.get("base") != self._file_crc:
+                    print("追加日志与数据文件不一致，已忽略")
+                    return 0
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        if not line.endswith(b"\n"):
+                            raise ValueError("缺少换行符")
+                        entry = orjson.loads(line) if ORJSON_AVAILABLE else json.loads(line)
+                    except ValueError:
+                        # 最后一行可能在写入时被中断，忽略不完整的行
+                        # 之后追加的条目会跟在这行后面而无法读取，下次保存时改为重写数据文件
+                        self._dirty = True
+                        break
+                    count += 1
+                    entries.append(entry)
+        except OSError as e:
+            print(f"读取追加日志失败: {e}")
+        
+        if count:
+            print(f"从追加日志恢复 {count} 条数据")
+        return count
+    
+    @staticmethod
+    def _encode_line(entry: Dict) -> bytes:
+        """把条目编码为追加日志中的一行"""
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(entry, option=orjson.OPT_NON_STR_KEYS) + b"\n"
+        return (json.dumps(entry, ensure_ascii=False) + "\n").encode('utf-8')
+    
+    def save_data(self, force: bool = False):
         """
         保存数据到JSON文件
-        将当前数据列表保存到指定的JSON文件中
+        只有新增条目时追加到日志文件；有修改、删除、导入，或日志过长时重写整个数据文件
+        
+        Args:
+            force: 是否强制重写整个数据文件，并合并追加日志
         """
+        if not force and not self._dirty:
+            if not self._pending_appends:
+                # 没有未保存的修改
+                return True
+            if self._log_count + len(self._pending_appends) <= LOG_COMPACT_THRESHOLD:
+                return self._append_log()
+        
         try:
-            # 打开数据文件进行写入操作
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                # 将数据列表转换为JSON格式并写入文件
+            # 先写入临时文件再替换数据文件，写入中途出错不会损坏原有数据
+            tmp_file = self.data_file + ".tmp"
+            # 数据文件只供程序读取，使用紧凑格式；需要阅读时可使用export_to_json导出
+            if ORJSON_AVAILABLE:
+                # orjson直接输出UTF-8字节，中文字符不会被转义
+                raw = orjson.dumps(list(self.data.values()), option=orjson.OPT_NON_STR_KEYS)
+            else:
+                # 将数据列表转换为JSON格式
                 # ensure_ascii=False: 允许中文字符正常显示
-                # indent=2: 设置缩进为2个空格，使JSON文件更易读
-                json.dump(self.data, f, ensure_ascii=False, indent=2)
+                # separators: 去掉多余空格，减小文件体积
+                raw = json.dumps(list(self.data.values()), ensure_ascii=False,
+                                 separators=(',', ':')).encode('utf-8')
+            with open(tmp_file, 'wb') as f:
+                f.write(raw)
+            # os.replace在Windows和POSIX上都是原子操作
+            os.replace(tmp_file, self.data_file)
+            # 旧日志的校验值与新数据文件不一致，即使下面删除失败也不会再被回放
+            self._file_crc = zlib.crc32(raw)
+            # 数据文件已包含所有条目，删除追加日志
+            if os.path.exists(self.log_file):
+                os.remove(self.log_file)
+            self._log_count = 0
+            self._dirty = False
+            self._pending_appends = []
             # 打印成功保存的数据条数
             print(f"成功保存 {len(self.data)} 条数据")
             return True
@@ -76,6 +277,40 @@ class InformationDatabase:
             print(f"保存数据失败: {e}")
             return False
     
+    def compact(self) -> bool:
+        """
+        把追加日志合并回数据文件
+        日志中没有条目且没有未保存的修改时不重写数据文件
+        """
+        if not (self._log_count or self._dirty or self._pending_appends):
+            return True
+        return self.save_data(force=True)
+    
+    def _append_log(self) -> bool:
+        """把新增条目追加到日志文件"""
+        try:
+            lines = b"".join(self._encode_line(entry) for entry in self._pending_appends)
+            if self._log_count:
+                with open(self.log_file, 'ab') as f:
+                    f.write(lines)
+            else:
+                # 开始新的日志，同时覆盖作废的旧日志，第一行记录当前数据文件的校验值
+                header = json.dumps({"base": self._file_crc}).encode('utf-8') + b"\n"
+                with open(self.log_file, 'wb') as f:
+                    f.write(header + lines)
+            self._log_count += len(self._pending_appends)
+            print(f"成功追加 {len(self._pending_appends)} 条数据")
+            self._pending_appends = []
+            return True
+        except Exception as e:
+            print(f"保存数据失败: {e}")
+            return False
+    
+    @staticmethod
+    def _clean_tags(tags: List[str]) -> List[str]:
+        """去除标签首尾空格并丢弃空标签，每个标签只strip一次"""
+        return [tag for tag in (tag.strip() for tag in tags) if tag]
+    
     def add_entry(self, title: str, content: str, url: str, tags: List[str] = None, 
                   content_type: str = "article", metadata: dict = None) -> bool:
         """
@@ -111,37 +346,28 @@ class InformationDatabase:
         if metadata is None:
             metadata = {}
         
-        # 根据内容类型生成不同的搜索文本
-        # 将标题转换为小写并添加到搜索部分
-        searchable_parts = [title.lower()]
-        # 如果内容不为空，将内容转换为小写并添加
-        if content.strip():
-            searchable_parts.append(content.lower())
-        # 将所有标签转换为小写并添加
-        searchable_parts.extend([tag.lower() for tag in tags if tag.strip()])
-        
-        # 添加类型特定的搜索内容
-        # 如果元数据中包含内容类型相关的信息，也添加到搜索文本中
-        if content_type in metadata:
-            searchable_parts.append(str(metadata[content_type]).lower())
+        # 创建时间和更新时间相同，保存为Unix时间戳，显示时再格式化
+        now = int(time.time())
         
         # 创建新的信息条目字典
         # 包含所有必要的字段和元数据
         entry = {
-            "id": len(self.data) + 1,  # 自动生成唯一ID
+            "id": self._next_id,  # 自动生成唯一ID
             "title": title.strip(),      # 去除首尾空格的标题
             "content": content.strip(),  # 去除首尾空格的内容
             "url": url.strip(),          # 去除首尾空格的URL
-            "tags": [tag.strip() for tag in tags if tag.strip()],  # 清理标签列表
+            "tags": self._clean_tags(tags),  # 清理标签列表
             "content_type": content_type,  # 内容类型
             "metadata": metadata,        # 元数据字典
-            "searchable_text": " ".join(searchable_parts),  # 合并搜索文本
-            "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),  # 创建时间
-            "updated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")   # 更新时间
+            "created_at": now,  # 创建时间
+            "updated_at": now   # 更新时间
         }
         
-        # 将新条目添加到数据列表中
-        self.data.append(entry)
+        # 将新条目添加到数据字典中
+        self._next_id += 1
+        self.data[entry["id"]] = entry
+        self._index_entry(entry)
+        self._pending_appends.append(entry)
         return True
     
     def update_entry(self, entry_id: int, title: str = None, content: str = None, 
@@ -161,48 +387,44 @@ class InformationDatabase:
             metadata: 新元数据
             
         Returns:
-            是否更新成功
-        """
-        # 遍历数据列表，查找指定ID的条目
-        for entry in self.data:
-            if entry["id"] == entry_id:
-                # 如果提供了新标题，更新标题
-                if title is not None:
-                    entry["title"] = title.strip()
-                # 如果提供了新内容，更新内容
-                if content is not None:
-                    entry["content"] = content.strip()
-                # 如果提供了新URL，更新URL
-                if url is not None:
-                    entry["url"] = url.strip()
-                # 如果提供了新标签，更新标签列表
-                if tags is not None:
-                    entry["tags"] = [tag.strip() for tag in tags if tag.strip()]
-                # 如果提供了新内容类型，更新内容类型
-                if content_type is not None:
-                    entry["content_type"] = content_type
-                # 如果提供了新元数据，更新元数据
-                if metadata is not None:
-                    entry["metadata"] = metadata
-                
-                # 更新搜索文本和时间戳
-                # 重新生成搜索文本，包含更新后的内容
-                searchable_parts = [entry["title"].lower()]
-                # 如果内容不为空，添加到搜索文本中
-                if entry["content"].strip():
-                    searchable_parts.append(entry["content"].lower())
-                # 将所有标签添加到搜索文本中
-                searchable_parts.extend([tag.lower() for tag in entry["tags"] if tag.strip()])
-                
-                # 添加类型特定的搜索内容
-                # 如果元数据中包含内容类型相关的信息，也添加到搜索文本中
-                if entry["content_type"] in entry.get("metadata", {}):
-                    searchable_parts.append(str(entry["metadata"][entry["content_type"]]).lower())
-                
-                # 更新搜索文本和更新时间
-                entry["searchable_text"] = " ".join(searchable_parts)
-                entry["updated_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            是否找到并更新了条目（内容没有变化时也返回True）
+        """
+        # 按ID直接查找条目
+        entry = self.data.get(entry_id)
+        if entry is not None:
+            updates = {}
+            # 如果提供了新标题，更新标题
+            if title is not None:
+                updates["title"] = title.strip()
+            # 如果提供了新内容，更新内容
+            if content is not None:
+                updates["content"] = content.strip()
+            # 如果提供了新URL，更新URL
+            if url is not None:
+                updates["url"] = url.strip()
+            # 如果提供了新标签，更新标签列表
+            if tags is not None:
+                updates["tags"] = self._clean_tags(tags)
+            # 如果提供了新内容类型，更新内容类型
+            if content_type is not None:
+                updates["content_type"] = content_type
+            # 如果提供了新元数据，更新元数据
+            if metadata is not None:
+                updates["metadata"] = metadata
+            
+            # 只保留与原值不同的字段，没有变化时不更新时间戳，也不需要保存
+            changed = {key: value for key, value in updates.items() if entry.get(key) != value}
+            if not changed:
                 return True
+            
+            entry.update(changed)
+            # 更新时间戳
+            entry["updated_at"] = int(time.time())
+            # 只有参与搜索的字段变化时才重新生成小写字段
+            if changed.keys() & {"title", "content", "tags"}:
+                self._index_entry(entry)
+            self._dirty = True
+            return True
         
         # 如果未找到指定ID的条目，打印错误信息
         print(f"未找到ID为 {entry_id} 的条目")
@@ -219,24 +441,24 @@ class InformationDatabase:
         Returns:
             是否删除成功
         """
-        # 遍历数据列表，查找指定ID的条目
-        for i, entry in enumerate(self.data):
-            if entry["id"] == entry_id:
-                # 找到指定条目，从列表中删除
-                del self.data[i]
-                return True
+        # 按ID直接从字典中删除，不需要移动其他条目
+        if self.data.pop(entry_id, None) is not None:
+            self._unindex_entry(entry_id)
+            self._dirty = True
+            return True
         
         # 如果未找到指定ID的条目，打印错误信息
         print(f"未找到ID为 {entry_id} 的条目")
         return False
     
-    def search(self, query: str) -> List[Dict]:
+    def search(self, query: str, limit: Optional[int] = None) -> List[Dict]:
         """
         搜索信息库
         使用模糊搜索算法在信息库中查找匹配的条目
         
         Args:
             query: 搜索关键词
+            limit: 最多返回的结果数，None表示返回全部结果
             
         Returns:
             搜索结果列表，按匹配度排序
@@ -247,38 +469,59 @@ class InformationDatabase:
         
         # 将查询转换为小写，便于匹配
         query = query.lower()
+        
+        # 相同查询直接返回缓存结果的副本，并标记为最近使用
+        cache_key = (query, limit)
+        cached = self._search_cache.get(cache_key)
+        if cached is not None:
+            self._search_cache.move_to_end(cache_key)
+            return list(cached)
+        
+        found = self._search_uncached(query, limit)
+        self._search_cache[cache_key] = found
+        # 超出容量时淘汰最久未使用的查询
+        if len(self._search_cache) > SEARCH_CACHE_SIZE:
+            self._search_cache.popitem(last=False)
+        return list(found)
+    
+    def _search_uncached(self, query: str, limit: Optional[int]) -> List[Dict]:
+        """计算小写查询词的搜索结果，不使用缓存"""
         results = []
         
-        # 遍历所有数据条目，计算匹配度
-        for entry in self.data:
+        # 按添加顺序遍历条目及其预先计算的小写字段，计算匹配度
+        for entry_id, entry in self.data.items():
+            title_lc = self._titles_lc[entry_id]
+            content_lc = self._contents_lc[entry_id]
+            tags_lc = self._tags_lc[entry_id]
+            
             # 初始化匹配度分数
             score = 0
             
             # 标题完全匹配：如果查询词在标题中，增加10分
-            if query in entry["title"].lower():
+            if query in title_lc:
                 score += 10
             
-            # 内容匹配：如果查询词在内容中，增加5分
-            # 内容匹配：使用正则表达式计算内容中查询词的出现次数
-            content_matches = len(re.findall(query, entry["content"].lower()))
+            # 内容匹配：计算内容中查询词的出现次数
+            # 查询词按普通字符串处理，用str.count代替正则，避免特殊字符出错
+            content_matches = content_lc.count(query)
             # 每个匹配增加2分
             score += content_matches * 2
             
             # 标签匹配：如果查询词在标签中，增加5分
-            for tag in entry["tags"]:
-                if query in tag.lower():
+            for tag in tags_lc:
+                if query in tag:
                     score += 5
             
-            # 可搜索文本匹配：在合并的搜索文本中查找匹配
-            text_matches = len(re.findall(query, entry["searchable_text"]))
-            # 每个匹配增加1分
-            score += text_matches
-            
             # 如果匹配度大于0，将条目和分数添加到结果中
             if score > 0:
                 results.append((entry, score))
         
         # 按匹配度分数降序排序，返回条目列表
+        # 只需要前limit条时用堆选取，不必对全部结果排序
+        if limit is not None:
+            top = heapq.nlargest(limit, results, key=lambda x: x[1])
+            return [result[0] for result in top]
+        
         results.sort(key=lambda x: x[1], reverse=True)
         return [result[0] for result in results]
     
@@ -290,7 +533,17 @@ class InformationDatabase:
         Returns:
             所有条目的列表
         """
-        return self.data.copy()
+        return list(self.data.values())
+    
+    def iter_entries(self) -> Iterator[Dict]:
+        """
+        按添加顺序遍历所有条目
+        不复制条目列表，适合只读取的场景；遍历过程中不能增删条目
+        
+        Returns:
+            条目迭代器
+        """
+        return iter(self.data.values())
     
     def get_entry_by_id(self, entry_id: int) -> Optional[Dict]:
         """
@@ -303,10 +556,7 @@ class InformationDatabase:
         Returns:
             找到的条目，如果未找到则返回None
         """
-        for entry in self.data:
-            if entry["id"] == entry_id:
-                return entry
-        return None
+        return self.data.get(entry_id)
     
     def export_to_json(self, filename: str = None) -> bool:
         """
@@ -323,7 +573,7 @@ class InformationDatabase:
         
         try:
             with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(self.data, f, ensure_ascii=False, indent=2)
+                json.dump(list(self.data.values()), f, ensure_ascii=False, indent=2)
             print(f"成功导出到 {filename}")
             return True
         except Exception as e:
@@ -345,15 +595,32 @@ class InformationDatabase:
                 imported_data = json.load(f)
             
             if isinstance(imported_data, list):
-                # 重新分配ID
-                for i, entry in enumerate(imported_data):
-                    entry["id"] = len(self.data) + i + 1
-                    entry["searchable_text"] = f"{entry['title']} {entry['content']} {' '.join(entry.get('tags', []))}".lower()
-                    if "created_at" not in entry:
-                        entry["created_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    entry["updated_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                # 先检查并补全所有条目，任何一条不合法都不导入，信息库保持不变
+                # 同一批导入的条目使用同一个时间戳
+                now = int(time.time())
+                for entry in imported_data:
+                    if not isinstance(entry, dict):
+                        raise ValueError("条目不是JSON对象")
+                    if not isinstance(entry.get("title"), str) or not isinstance(entry.get("content"), str):
+                        raise ValueError("条目缺少标题或内容")
+                    tags = entry.get("tags", [])
+                    if not isinstance(tags, list) or not all(isinstance(tag, str) for tag in tags):
+                        raise ValueError("条目的标签必须是字符串列表")
+                    entry["tags"] = self._clean_tags(tags)
+                    entry.setdefault("url", "")
+                    entry.setdefault("content_type", "article")
+                    entry.setdefault("metadata", {})
+                    entry.pop("searchable_text", None)
+                    entry.setdefault("created_at", now)
+                    entry["updated_at"] = now
                 
-                self.data.extend(imported_data)
+                # 重新分配ID，从当前最大ID之后开始，避免与已有条目冲突
+                for entry in imported_data:
+                    entry["id"] = self._next_id
+                    self._next_id += 1
+                    self.data[entry["id"]] = entry
+                    self._index_entry(entry)
+                self._dirty = True
                 print(f"成功导入 {len(imported_data)} 条数据")
                 return True
             else:
@@ -366,14 +633,14 @@ class InformationDatabase:
     def get_content_types(self) -> Dict[str, int]:
         """获取内容类型统计"""
         type_count = {}
-        for entry in self.data:
+        for entry in self.data.values():
             content_type = entry.get("content_type", "article")
             type_count[content_type] = type_count.get(content_type, 0) + 1
         return type_count
     
     def get_entries_by_type(self, content_type: str) -> List[Dict]:
         """根据内容类型获取条目"""
-        return [entry for entry in self.data if entry.get("content_type") == content_type]
+        return [entry for entry in self.data.values() if entry.get("content_type") == content_type]
     
     def get_content_type_info(self) -> Dict[str, str]:
         """获取内容类型说明"""
@@ -392,18 +659,27 @@ class InformationDatabase:
         """获取信息库统计信息"""
         total_entries = len(self.data)
         total_tags = set()
-        content_types = self.get_content_types()
+        content_types = {}
+        
+        # 一次遍历同时统计标签和内容类型
+        for entry in self.data.values():
+            total_tags.update(entry.get("tags", ()))
+            content_type = entry.get("content_type", "article")
+            content_types[content_type] = content_types.get(content_type, 0) + 1
         
-        for entry in self.data:
-            total_tags.update(entry.get("tags", []))
+        # 一次stat调用同时判断文件是否存在并获取大小
+        try:
+            file_size = os.stat(self.data_file).st_size
+        except OSError:
+            file_size = 0
         
         return {
             "total_entries": total_entries,
             "total_tags": len(total_tags),
-            "tags_list": sorted(list(total_tags)),
+            "tags_list": sorted(total_tags),
             "content_types": content_types,
             "data_file": self.data_file,
-            "file_size": os.path.getsize(self.data_file) if os.path.exists(self.data_file) else 0
+            "file_size": file_size
         }
 
 if __name__ == "__main__":
@@ -7,9 +7,6 @@
 """
 
 import tkinter as tk
-from tkinter import messagebox
-import customtkinter as ctk
-import platform
 import subprocess
 import sys
 import os
@@ -18,9 +15,59 @@ import os
 from config import config
 from exceptions import safe_execute, UIError, error_handler
 
-# 设置 CustomTkinter 外观
-ctk.set_appearance_mode("auto")  # "auto", "dark", "light"
-ctk.set_default_color_theme("blue")  # "blue", "green", "dark-blue"
+# CustomTkinter 外观是否已经设置过
+_ctk_configured = False
+
+def _configure_ctk_once(ctk):
+    """设置 CustomTkinter 外观，多次创建启动器时只设置一次"""
+    global _ctk_configured
+    if _ctk_configured:
+        return
+    ctk.set_appearance_mode("auto")  # "auto", "dark", "light"
+    ctk.set_default_color_theme("blue")  # "blue", "green", "dark-blue"
+    _ctk_configured = True
+
+# 启动子程序使用的Python解释器
+_PY = sys.executable
+
+# 搜索界面脚本及其版本说明，按优先顺序排列
+_SEARCH_SCRIPTS = (
+    ("google.py", "改进版本"),
+    ("google_simple.py", "简化版本"),
+    ("google_refactored.py", "重构版本"),
+)
+
+# 主窗口和帮助窗口的大小（宽, 高）
+_MAIN_WINDOW_SIZE = (550, 650)
+_HELP_WINDOW_SIZE = (650, 550)
+
+# 帮助对话框的文本内容
+_HELP_TEXT = """
+信息库系统使用说明
+
+🔍 搜索界面 (google.py)
+- 模拟Google搜索页面
+- 支持关键词搜索本地信息库
+- 点击搜索结果查看详细内容
+
+📝 数据管理 (data_manager.py)
+- 添加、编辑、删除信息条目
+- 支持标签分类管理
+- 导入/导出JSON格式数据
+- 实时搜索和过滤功能
+
+💡 使用技巧
+1. 先在数据管理中添加信息内容
+2. 然后在搜索界面中搜索和查看
+3. 支持中文搜索和标签分类
+4. 数据自动保存到JSON文件
+
+📁 文件说明
+- information_database.py: 信息库核心模块
+- google.py: 搜索界面
+- data_manager.py: 数据管理界面
+- information_database.json: 数据存储文件
+"""
 
 class LauncherGUI:
     """
@@ -32,143 +79,198 @@ class LauncherGUI:
     def __init__(self):
         """
         初始化启动器GUI
-        设置字体，创建主窗口和界面组件
+        创建主窗口，设置字体，创建界面组件
         """
-        # 设置系统字体
-        self.setup_fonts()
+        # 用posix_spawn启动的子进程ID，用于回收已退出的子进程
+        self._children = []
+        # 帮助窗口只创建一次，关闭时隐藏
+        self._help_window = None
+        # 读取当前目录中的文件列表
+        self._refresh_presence()
         # 创建主窗口
         self.setup_main_window()
+        # 设置系统字体（字体对象需要在根窗口创建之后生成）
+        self.setup_fonts()
         # 创建界面组件
         self.setup_widgets()
     
+    def _refresh_presence(self):
+        """
+        读取当前目录中的文件名
+        一次scandir代替对每个脚本分别调用os.path.exists
+        """
+        try:
+            with os.scandir(".") as entries:
+                self._present = frozenset(entry.name for entry in entries if entry.is_file())
+        except OSError:
+            self._present = frozenset()
+    
+    def _spawn(self, script):
+        """
+        用当前Python解释器在新进程中运行脚本
+        POSIX系统上使用posix_spawn，不必像fork那样复制启动器进程的内存
+        """
+        if hasattr(os, "posix_spawn"):
+            # 回收已经退出的子进程，避免留下僵尸进程
+            self._children = [pid for pid in self._children
+                              if os.waitpid(pid, os.WNOHANG) == (0, 0)]
+            self._children.append(os.posix_spawn(_PY, (_PY, script), os.environ))
+        else:
+            # env=None让子进程直接继承当前环境变量
+            subprocess.Popen((_PY, script), close_fds=False, env=None)
+    
     def setup_fonts(self):
         """
         设置系统字体
         使用配置模块中的字体设置，避免重复代码
+        预先创建界面用到的字体对象，各组件共享同一个对象
         """
         font_config = config.get_font_config("default")
         self.font_family = font_config.family
+        
+        ctk = self.ctk
+        family = self.font_family
+        self._fonts = {
+            "title": ctk.CTkFont(family=family, size=28, weight="bold"),
+            "subtitle": ctk.CTkFont(family=family, size=14),
+            "button": ctk.CTkFont(family=family, size=16, weight="bold"),
+            "small": ctk.CTkFont(family=family, size=12),
+            "help_title": ctk.CTkFont(family=family, size=24, weight="bold"),
+            "help_body": ctk.CTkFont(family=family, size=13),
+        }
     
     def setup_main_window(self):
         """
         设置主窗口
         创建CustomTkinter根窗口，设置标题、大小等基本属性
         """
+        # 需要创建窗口时才导入CustomTkinter，它会连带加载PIL和主题文件
+        import customtkinter as ctk
+        self.ctk = ctk
+        _configure_ctk_once(ctk)
+        
         # 创建CustomTkinter根窗口实例
         self.root = ctk.CTk()
         # 设置窗口标题，包含项目名称
         self.root.title("信息库系统启动器 - Lazymice Project")
-        # 设置窗口初始大小为550x650像素
-        self.root.geometry("550x650")
         # 允许窗口调整大小
         self.root.resizable(True, True)
         # 设置最小窗口大小为500x400像素，防止界面过小
         self.root.minsize(500, 400)
         
-        # 将窗口居中显示在屏幕上
-        self.center_window()
+        # 屏幕尺寸只查询一次，主窗口和帮助窗口居中时共用
+        self._screen_w = self.root.winfo_screenwidth()
+        self._screen_h = self.root.winfo_screenheight()
+        
+        # 设置窗口初始大小为550x650像素，并居中显示在屏幕上
+        self.center_window(self.root, *_MAIN_WINDOW_SIZE)
     
-    def center_window(self):
+    def center_window(self, window, width, height):
         """
         窗口居中显示
-        计算屏幕尺寸，将窗口定位在屏幕中央
+        按给定的窗口大小和缓存的屏幕尺寸，将窗口定位在屏幕中央
+        窗口大小已知，不需要先刷新界面再查询窗口尺寸
         """
-        # 更新窗口尺寸信息
-        self.root.update_idletasks()
-        # 获取窗口的宽度和高度
-        width = self.root.winfo_width()
-        height = self.root.winfo_height()
         # 计算窗口在屏幕中的居中位置
-        x = (self.root.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.root.winfo_screenheight() // 2) - (height // 2)
-        # 设置窗口位置
-        self.root.geometry(f"{width}x{height}+{x}+{y}")
+        x = (self._screen_w // 2) - (width // 2)
+        y = (self._screen_h // 2) - (height // 2)
+        # 同时设置窗口大小和位置
+        window.geometry(f"{width}x{height}+{x}+{y}")
     
     def setup_widgets(self):
         """
         设置界面组件
         创建主界面的所有组件，包括标题、按钮等
         """
+        ctk = self.ctk
         # 创建主框架
         main_frame = ctk.CTkFrame(self.root, corner_radius=20)
         main_frame.pack(fill=tk.BOTH, expand=True, padx=30, pady=30)
         
         # 创建主标题标签
         title_label = ctk.CTkLabel(main_frame, text="信息库系统", 
-                                  font=ctk.CTkFont(family=self.font_family, size=28, weight="bold"))
+                                  font=self._fonts["title"])
         title_label.pack(pady=(30, 10))
         
         # 创建副标题标签
         subtitle_label = ctk.CTkLabel(main_frame, text="Lazymice Project - 本地信息库搜索系统", 
-                                     font=ctk.CTkFont(family=self.font_family, size=14))
+                                     font=self._fonts["subtitle"])
         subtitle_label.pack(pady=(0, 40))
         
-        # 创建按钮框架
-        button_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
-        button_frame.pack(fill=tk.X, padx=30)
-        
+        # 按钮直接放在主框架中，左右各留30像素边距
         # 创建搜索界面按钮
-        search_button = ctk.CTkButton(button_frame, text="仿Google检索界面", 
-                                     font=ctk.CTkFont(family=self.font_family, size=16, weight="bold"),
+        search_button = ctk.CTkButton(main_frame, text="仿Google检索界面", 
+                                     font=self._fonts["button"],
                                      height=50, corner_radius=12,
                                      command=self.open_search_interface)
-        search_button.pack(fill=tk.X, pady=(0, 15))
+        search_button.pack(fill=tk.X, padx=30, pady=(0, 15))
         
         # 创建数据管理按钮
-        manage_button = ctk.CTkButton(button_frame, text="打开数据管理", 
-                                     font=ctk.CTkFont(family=self.font_family, size=16, weight="bold"),
+        manage_button = ctk.CTkButton(main_frame, text="打开数据管理", 
+                                     font=self._fonts["button"],
                                      height=50, corner_radius=12,
                                      fg_color="#2fa572", hover_color="#106A43",
                                      command=self.open_data_manager)
-        manage_button.pack(fill=tk.X, pady=(0, 15))
+        manage_button.pack(fill=tk.X, padx=30, pady=(0, 15))
         
         # 创建帮助按钮
-        help_button = ctk.CTkButton(button_frame, text="使用帮助", 
-                                   font=ctk.CTkFont(family=self.font_family, size=16, weight="bold"),
+        help_button = ctk.CTkButton(main_frame, text="使用帮助", 
+                                   font=self._fonts["button"],
                                    height=50, corner_radius=12,
                                    fg_color="#ff9500", hover_color="#cc7700",
                                    command=self.show_help)
-        help_button.pack(fill=tk.X, pady=(0, 15))
+        help_button.pack(fill=tk.X, padx=30, pady=(0, 15))
         
         # 创建外观切换按钮
-        appearance_frame = ctk.CTkFrame(button_frame, fg_color="transparent")
-        appearance_frame.pack(fill=tk.X, pady=(10, 15))
+        # 标签和下拉菜单需要并排显示，保留一个透明框架
+        appearance_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
+        appearance_frame.pack(fill=tk.X, padx=30, pady=(10, 15))
         
         appearance_label = ctk.CTkLabel(appearance_frame, text="外观模式:", 
-                                       font=ctk.CTkFont(family=self.font_family, size=14))
+                                       font=self._fonts["subtitle"])
         appearance_label.pack(side=tk.LEFT, padx=(0, 10))
         
         self.appearance_mode = ctk.CTkOptionMenu(appearance_frame,
                                                values=["auto", "light", "dark"],
                                                command=self.change_appearance_mode,
-                                               font=ctk.CTkFont(family=self.font_family, size=12),
+                                               font=self._fonts["small"],
                                                width=120, height=32)
         self.appearance_mode.set("auto")
         self.appearance_mode.pack(side=tk.LEFT)
         
         # 创建退出按钮
-        exit_button = ctk.CTkButton(button_frame, text="❌ 退出", 
-                                   font=ctk.CTkFont(family=self.font_family, size=16, weight="bold"),
+        exit_button = ctk.CTkButton(main_frame, text="❌ 退出", 
+                                   font=self._fonts["button"],
                                    height=50, corner_radius=12,
                                    fg_color="#dc2626", hover_color="#991b1b",
                                    command=self.root.quit)
-        exit_button.pack(fill=tk.X)
-        
-        # 创建状态信息区域
-        status_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
-        status_frame.pack(fill=tk.X, pady=(30, 20), padx=30)
+        exit_button.pack(fill=tk.X, padx=30)
         
         # 创建状态标签
-        self.status_label = ctk.CTkLabel(status_frame, text="", 
-                                        font=ctk.CTkFont(family=self.font_family, size=12))
-        self.status_label.pack()
+        self.status_label = ctk.CTkLabel(main_frame, text="", 
+                                        font=self._fonts["small"])
+        self.status_label.pack(pady=(30, 20), padx=30)
+        # 最近一次显示的文件状态文本，定时刷新时用来判断是否有变化
+        self._files_status = ""
         
-        # 更新状态信息
-        self.update_status()
+        # 窗口显示后再检查文件状态，之后每5秒刷新一次
+        self.root.after_idle(self.update_status)
+        self.root.after(5000, self._periodic_status)
+    
+    def _periodic_status(self):
+        """
+        定时刷新状态信息，脚本文件出现或被删除时及时更新
+        文件状态没有变化时不改动状态栏，保留启动成功等提示
+        """
+        status_text = self._files_status_text()
+        if status_text != self._files_status:
+            self._files_status = status_text
+            self.status_label.configure(text=status_text)
+        self.root.after(5000, self._periodic_status)
     
     def change_appearance_mode(self, new_appearance_mode):
         """改变外观模式"""
-        ctk.set_appearance_mode(new_appearance_mode)
+        self.ctk.set_appearance_mode(new_appearance_mode)
     
     @safe_execute(UIError, show_user_error=True)
     def open_search_interface(self):
@@ -177,23 +279,18 @@ class LauncherGUI:
         启动Google搜索界面程序，优先使用重构版本
         使用安全执行装饰器处理异常
         """
+        # 优先使用改进版本的google.py（已修复路径问题和添加滚轮滑动）
+        for script, version in _SEARCH_SCRIPTS:
+            if script in self._present:
+                break
+        else:
+            raise UIError("未找到搜索界面文件", component="launcher", action="open_search")
+        
         try:
-            # 优先使用改进版本的google.py（已修复路径问题和添加滚轮滑动）
-            if os.path.exists("google.py"):
-                subprocess.Popen([sys.executable, "google.py"])
-                self.status_label.configure(text="✅ 搜索界面已启动 (改进版本)")
-            elif os.path.exists("google_simple.py"):
-                subprocess.Popen([sys.executable, "google_simple.py"])
-                self.status_label.configure(text="✅ 搜索界面已启动 (简化版本)")
-            elif os.path.exists("google_refactored.py"):
-                subprocess.Popen([sys.executable, "google_refactored.py"])
-                self.status_label.configure(text="✅ 搜索界面已启动 (重构版本)")
-            else:
-                raise UIError("未找到搜索界面文件", component="launcher", action="open_search")
-        except subprocess.SubprocessError as e:
-            raise UIError(f"启动搜索界面进程失败: {str(e)}", component="launcher", action="subprocess")
+            self._spawn(script)
         except Exception as e:
             raise UIError(f"启动搜索界面失败: {str(e)}", component="launcher", action="open_search")
+        self.status_label.configure(text=f"✅ 搜索界面已启动 ({version})")
     
     @safe_execute(UIError, show_user_error=True)
     def open_data_manager(self):
@@ -202,59 +299,35 @@ class LauncherGUI:
         启动数据管理程序
         使用安全执行装饰器处理异常
         """
+        if "data_manager.py" not in self._present:
+            raise UIError("未找到数据管理文件", component="launcher", action="open_data_manager")
+        
         try:
-            if os.path.exists("data_manager.py"):
-                subprocess.Popen([sys.executable, "data_manager.py"])
-                self.status_label.configure(text="✅ 数据管理界面已启动")
-            else:
-                raise UIError("未找到数据管理文件", component="launcher", action="open_data_manager")
-        except subprocess.SubprocessError as e:
-            raise UIError(f"启动数据管理进程失败: {str(e)}", component="launcher", action="subprocess")
+            self._spawn("data_manager.py")
         except Exception as e:
             raise UIError(f"启动数据管理界面失败: {str(e)}", component="launcher", action="open_data_manager")
+        self.status_label.configure(text="✅ 数据管理界面已启动")
     
     def show_help(self):
         """
         显示帮助信息
         弹出帮助对话框，介绍系统功能和使用方法
+        帮助窗口已经创建过时直接重新显示
         """
-        # 定义帮助文本内容
-        help_text = """
-信息库系统使用说明
-
-🔍 搜索界面 (google.py)
-- 模拟Google搜索页面
-- 支持关键词搜索本地信息库
-- 点击搜索结果查看详细内容
-
-📝 数据管理 (data_manager.py)
-- 添加、编辑、删除信息条目
-- 支持标签分类管理
-- 导入/导出JSON格式数据
-- 实时搜索和过滤功能
-
-💡 使用技巧
-1. 先在数据管理中添加信息内容
-2. 然后在搜索界面中搜索和查看
-3. 支持中文搜索和标签分类
-4. 数据自动保存到JSON文件
-
-📁 文件说明
-- information_database.py: 信息库核心模块
-- google.py: 搜索界面
-- data_manager.py: 数据管理界面
-- information_database.json: 数据存储文件
-        """
+        if self._help_window is not None and self._help_window.winfo_exists():
+            self._help_window.deiconify()
+            self._help_window.lift()
+            return
         
+        ctk = self.ctk
         help_window = ctk.CTkToplevel(self.root)
         help_window.title("使用帮助")
-        help_window.geometry("650x550")
+        # 关闭时只隐藏窗口，下次打开不必重新创建组件
+        help_window.protocol("WM_DELETE_WINDOW", help_window.withdraw)
+        self._help_window = help_window
         
         # 居中显示帮助窗口
-        help_window.update_idletasks()
-        x = (help_window.winfo_screenwidth() // 2) - (650 // 2)
-        y = (help_window.winfo_screenheight() // 2) - (550 // 2)
-        help_window.geometry(f"650x550+{x}+{y}")
+        self.center_window(help_window, *_HELP_WINDOW_SIZE)
         
         # 创建主框架
         main_frame = ctk.CTkFrame(help_window, corner_radius=15)
@@ -262,38 +335,43 @@ class LauncherGUI:
         
         # 添加标题
         title_label = ctk.CTkLabel(main_frame, text="📖 使用帮助", 
-                                  font=ctk.CTkFont(family=self.font_family, size=24, weight="bold"))
+                                  font=self._fonts["help_title"])
         title_label.pack(pady=(20, 10))
         
-        # 帮助内容
-        help_text_widget = ctk.CTkTextbox(main_frame, 
-                                         font=ctk.CTkFont(family=self.font_family, size=13),
-                                         wrap="word", corner_radius=10)
-        help_text_widget.pack(fill=tk.BOTH, expand=True, padx=20, pady=(10, 20))
-        help_text_widget.insert("0.0", help_text)
-        help_text_widget.configure(state="disabled")
+        # 帮助内容是固定的只读文本，用标签显示即可；文本比窗口高，放在可滚动框架中
+        body_frame = ctk.CTkScrollableFrame(main_frame, corner_radius=10)
+        body_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=(10, 20))
+        help_body = ctk.CTkLabel(body_frame, text=_HELP_TEXT,
+                                 font=self._fonts["help_body"],
+                                 justify="left", anchor="nw", wraplength=540)
+        help_body.pack(fill=tk.BOTH, expand=True, padx=10)
     
     def update_status(self):
         """更新状态信息"""
+        self._files_status = self._files_status_text()
+        self.status_label.configure(text=self._files_status)
+    
+    def _files_status_text(self):
+        """重新检查脚本文件，生成文件状态文本"""
+        self._refresh_presence()
         files_status = []
         
-        if os.path.exists("google.py"):
+        if "google.py" in self._present:
             files_status.append("搜索界面 ✓")
         else:
             files_status.append("搜索界面 ✗")
         
-        if os.path.exists("data_manager.py"):
+        if "data_manager.py" in self._present:
             files_status.append("数据管理 ✓")
         else:
             files_status.append("数据管理 ✗")
         
-        if os.path.exists("information_database.py"):
+        if "information_database.py" in self._present:
             files_status.append("信息库模块 ✓")
         else:
             files_status.append("信息库模块 ✗")
         
-        status_text = " | ".join(files_status)
-        self.status_label.configure(text=status_text)
+        return " | ".join(files_status)
     
     def run(self):
         """运行启动器"""